@@ -95,4 +95,48 @@ class Build:
                 "does exist and that the correct objectType has been "+ 
                 "specified.")
         
+        return
+    
+    async def addToHistory(self, commandName: str, vba: str):
+        """Send a block of VBA code to CST as a single history list entry.
+        
+        Useful for combining the code generated by several methods (e.g.
+        Shape.getCylinderVBA, Material.getMaterialFromLibVBA) so that CST only
+        has to process one history entry.
+
+        Parameters
+        ----------
+        commandName : str
+            Name of the entry in the history list.
+        vba : str
+            VBA code to be executed.
+
+        Raises
+        ------
+        TypeError
+            If commandName is not of type str.
+        TypeError
+            If vba is not of type str.
+        RuntimeError
+            If the VBA code is not successfully executed by CST.
+        """
+        
+        # Check that commandName is of type str
+        if not isinstance(commandName, str):
+            raise TypeError("ERROR: commandName must be of type str.")
+        
+        # Check that vba is of type str
+        if not isinstance(vba, str):
+            raise TypeError("ERROR: vba must be of type str.")
+        
+        # Send the VBA code to CST
+        self.__MWS._FlagAsMethod("AddToHistory")
+        result = self.__MWS.AddToHistory(commandName, vba)
+        
+        # Raise an exception if the code is not executed successfully.
+        if result != True:
+            raise RuntimeError(
+                "ERROR: Execution of the VBA code for " +
+                "{} was not successful.".format(commandName))
+        
         return
\ No newline at end of file
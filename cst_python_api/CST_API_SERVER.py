@@ -1,78 +1,183 @@
-from re import I
+import asyncio
+import inspect
+import typing
+
 from mcp.server.fastmcp import FastMCP
 
+from .Boolean import Boolean
+from .Build import Build
+from .Component import Component
+from .CST_MicrowaveStudio import CST_MicrowaveStudio
+from .Material import Material, materials_dir
+from .Parameter import Parameter
+from .Port import Port
+from .Project import Project
+from .Results import Results
+from .Shape import Shape
+from .Solver import Solver
+from .Transform import Transform
+from .assemblies import create_coax_and_port
+from .analysis import (
+    get_boresight_metrics,
+    get_gain_at_freq,
+    get_axial_ratio_at_freq,
+)
 
 
 mcp = FastMCP("CST_API_SERVER")
 
-mcp.tool(Boolean.add)
-mcp.tool(Boolean.subtract)
-mcp.tool(Boolean.intersect)
-mcp.tool(Boolean.insert)
-mcp.tool(Boolean.mergeCommonMaterials)
-
-mcp.tool(Build.deleteObject)
-
-mcp.tool(CheckParam.doCheck)
-
-mcp.tool(Component.new)
-mcp.tool(Component.delete)
-mcp.tool(Component.rename)
-mcp.tool(Component.exist)
-mcp.tool(Component.ensureExistence)
-
-mcp.tool(CST_MicrowaveStudio.__openFile)
-mcp.tool(CST_MicrowaveStudio.__checkExtension)
-mcp.tool(CST_MicrowaveStudio.saveFile)
-mcp.tool(CST_MicrowaveStudio.closeFile)
-mcp.tool(CST_MicrowaveStudio.quit)
-
-mcp.tool(Material.addNormalMaterial)
-mcp.tool(Material.addAnisotropicMaterial)
-mcp.tool(Material.addMaterialFromLib)
-
-mcp.tool(Shape.addBrick)
-mcp.tool(Shape.addCylinder)
-mcp.tool(Shape.addSphere)
-mcp.tool(Shape.addPolygonBlock)
-
-mcp.tool(Transform.translate)
-mcp.tool(Transform.rotate)      
-mcp.tool(Transform.mirror)
-mcp.tool(Transform.scale)  
-
-mcp.tool(Parameter.add)
-mcp.tool(Parameter.delete)
-mcp.tool(Parameter.exist)
-mcp.tool(Parameter.change)
-mcp.tool(Parameter.retrieve)
-mcp.tool(Parameter.addDescription)
-mcp.tool(Parameter.retrieveDescription)
-
-mcp.tool(Port.addWaveguidePort)
-mcp.tool(Port.addDiscretePort)
-
-mcp.tool(Project.setUnits)
-
-mcp.tool(Results.getSParameters)
-mcp.tool(Results.getFarField)
-mcp.tool(Results._portNumberProcessor)
-
-
-mcp.tool(Solver.setFrequencyRange)
-mcp.tool(Solver.getSolverType)
-mcp.tool(Solver.changeSolverType)
-mcp.tool(Solver.setBoundaryCondition)
-mcp.tool(Solver.addSymmetryPlane)
-mcp.tool(Solver.addFieldMonitor)
-mcp.tool(Solver.setBackgroundMaterial)
-mcp.tool(Solver.setBackgroundLimits)
-mcp.tool(Solver.defineFloquetModes)
-mcp.tool(Solver.runSimulation)
-
-mcp.tool(create_coax_and_port)
-mcp.tool(get_axial_ratio_at_freq)
-mcp.tool(get_gain_at_freq)
+# materials_dir does not change while the server runs, so convert it once.
+_MATERIALS_DIR_STR = str(materials_dir)
+
+# Methods taking NumPy arrays (Shape.addPolygonBlock, Results.getFarField)
+# are not exposed: their arguments cannot be described by a JSON schema.
+TOOLS = [
+    Boolean.add,
+    Boolean.subtract,
+    Boolean.intersect,
+    Boolean.insert,
+    Boolean.mergeCommonMaterials,
+
+    Build.deleteObject,
+
+    Component.new,
+    Component.delete,
+    Component.rename,
+    Component.exist,
+    Component.ensureExistence,
+
+    CST_MicrowaveStudio.saveFile,
+    CST_MicrowaveStudio.closeFile,
+    CST_MicrowaveStudio.quit,
+
+    Material.addNormalMaterial,
+    Material.addAnisotropicMaterial,
+    Material.addMaterialFromLib,
+
+    Shape.addBrick,
+    Shape.addCylinder,
+    Shape.addSphere,
+
+    Transform.translate,
+    Transform.rotate,
+    Transform.mirror,
+    Transform.scale,
+
+    Parameter.add,
+    Parameter.delete,
+    Parameter.exist,
+    Parameter.change,
+    Parameter.retrieve,
+    Parameter.addDescription,
+    Parameter.retrieveDescription,
+
+    Port.addWaveguidePort,
+    Port.addDiscretePort,
+
+    Project.setUnits,
+
+    Results.getSParameters,
+
+    Solver.setFrequencyRange,
+    Solver.getSolverType,
+    Solver.changeSolverType,
+    Solver.setBoundaryCondition,
+    Solver.addSymmetryPlane,
+    Solver.addFieldMonitor,
+    Solver.setBackgroundMaterial,
+    Solver.setBackgroundLimits,
+    Solver.defineFloquetModes,
+    Solver.runSimulation,
+
+    create_coax_and_port,
+    get_boresight_metrics,
+    get_axial_ratio_at_freq,
+    get_gain_at_freq,
+]
+
+# MCP clients can only send JSON arguments, so the project (self, or myCST
+# for the module-level helpers) is supplied by the server. It connects to the
+# project currently active in CST on the first tool call.
+_project = None
+_project_lock = asyncio.Lock()
+
+# Path from the CST_MicrowaveStudio instance to the object owning each method.
+# Module-level functions ("") receive the project itself.
+_OWNERS = {
+    "": lambda cst: cst,
+    "CST_MicrowaveStudio": lambda cst: cst,
+    "Project": lambda cst: cst.Project,
+    "Parameter": lambda cst: cst.Project.Parameter,
+    "Solver": lambda cst: cst.Solver,
+    "Port": lambda cst: cst.Solver.Port,
+    "Results": lambda cst: cst.Results,
+    "Build": lambda cst: cst.Build,
+    "Boolean": lambda cst: cst.Build.Boolean,
+    "Component": lambda cst: cst.Build.Component,
+    "Material": lambda cst: cst.Build.Material,
+    "Shape": lambda cst: cst.Build.Shape,
+    "Transform": lambda cst: cst.Build.Transform,
+}
+
+# Tools after which the project handle is no longer valid.
+_CLOSING = (CST_MicrowaveStudio.closeFile, CST_MicrowaveStudio.quit)
+
+
+async def _get_project():
+    """Return the CST project used by the tools, connecting to it if needed."""
+
+    global _project
+    async with _project_lock:
+        if _project is None:
+            # CST_MicrowaveStudio.__init__ is a coroutine, so it is awaited
+            # explicitly on a bare instance.
+            project = CST_MicrowaveStudio.__new__(CST_MicrowaveStudio)
+            await project.__init__()
+            _project = project
+        return _project
+
+
+def _bind(fn):
+    """Wrap fn so that its first argument is taken from the server project."""
+
+    owner_name, _, _ = fn.__qualname__.rpartition(".")
+    owner = _OWNERS[owner_name]
+
+    async def tool(*args, **kwargs):
+        global _project
+        result = await fn(owner(await _get_project()), *args, **kwargs)
+        if fn in _CLOSING:
+            _project = None
+        return result
+
+    # Publish the signature without its first parameter. Annotations are
+    # resolved here because FastMCP evaluates them in this module's globals.
+    signature = inspect.signature(fn)
+    hints = typing.get_type_hints(fn)
+    tool.__signature__ = signature.replace(
+        parameters=[
+            param.replace(annotation=hints.get(param.name, param.annotation))
+            for param in list(signature.parameters.values())[1:]
+        ],
+        return_annotation=hints.get("return", signature.return_annotation),
+    )
+    tool.__name__ = fn.__name__
+    tool.__qualname__ = fn.__qualname__
+    tool.__doc__ = fn.__doc__
+    return tool
+
+
+# Several classes share method names (add, delete, exist...), so tools are
+# named after the qualified name, e.g. Parameter_add.
+for tool in TOOLS:
+    mcp.add_tool(_bind(tool), name=tool.__qualname__.replace(".", "_"))
+
+
+@mcp.resource("cst://materials_dir", mime_type="text/plain")
+def get_materials_dir() -> str:
+    """Folder holding the CST material library (.mtd) files."""
+    return _MATERIALS_DIR_STR
+
 
 if __name__ == "__main__":
     mcp.run(transport="stdio")
\ No newline at end of file
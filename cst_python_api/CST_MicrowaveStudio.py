@@ -7,6 +7,7 @@ import win32com.client
 import os.path
 
 from .constants import *
+from .cache import forget_project
 
 # Import project classes
 from .Project import Project
@@ -219,6 +220,7 @@ class CST_MicrowaveStudio:
         """Closes the currently open Microwave Studio project.
         """
     
+        forget_project(self)
         self.__MWS._FlagAsMethod("Quit")
         self.__MWS.Quit()
         
@@ -226,5 +228,6 @@ class CST_MicrowaveStudio:
         """Closes the CST application.
         """
         
+        forget_project(self)
         self.__CST.Quit()
         
\ No newline at end of file
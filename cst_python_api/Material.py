@@ -3,7 +3,7 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import List
 import os
 from .CheckParam import CheckParam
 
@@ -303,7 +303,41 @@ class Material:
         
         return
     
-    async def addMaterialFromLib(self, material_name: str) -> str:
+    async def addMaterialFromLib(self, material_name: str):
+        """
+        Add a material from the CST library by parsing its .mtd file.
+    
+        Parameters
+        ----------
+        material_name : str
+            Base name of the material file (without .mtd).
+    
+        Raises
+        ------
+        FileNotFoundError
+            If '<materials_dir>/<material_name>.mtd' does not exist.
+        ValueError
+            If the file does not contain a [Definition] or [Type] section.
+        RuntimeError
+            If the VBA code generated by this method is not successfully
+            executed by CST.
+        """
+        
+        # Generate the VBA code for the material
+        vba = await self.getMaterialFromLibVBA(material_name)
+
+        # Send the VBA code to CST
+        self.__MWS._FlagAsMethod("AddToHistory")
+        result = self.__MWS.AddToHistory("define material: " + material_name, vba)
+        
+        # Raise an exception if the code is not executed successfully.
+        if result != True:
+            raise RuntimeError("ERROR: Execution of the VBA code for creating" +
+                               " the new material was not successful.")
+        
+        return
+
+    async def getMaterialFromLibVBA(self, material_name: str) -> str:
         """
         Generate a VBA macro for a CST material by parsing its .mtd file.
     
@@ -311,8 +345,6 @@ class Material:
         ----------
         material_name : str
             Base name of the material file (without .mtd).
-        folder_path : str
-            Directory path where the .mtd files are stored.
     
         Returns
         -------
@@ -322,7 +354,7 @@ class Material:
         Raises
         ------
         FileNotFoundError
-            If '<folder_path>/<material_name>.mtd' does not exist.
+            If '<materials_dir>/<material_name>.mtd' does not exist.
         ValueError
             If the file does not contain a [Definition] or [Type] section.
         """
@@ -371,14 +403,5 @@ class Material:
         vba += ["    .Create",
                 "End With"]
 
-        # Send the VBA code to CST
-        self.__MWS._FlagAsMethod("AddToHistory")
-        result = self.__MWS.AddToHistory("define material: " + material_name, "\n".join(vba))
-        
-        # Raise an exception if the code is not executed successfully.
-        if result != True:
-            raise RuntimeError("ERROR: Execution of the VBA code for creating" +
-                               " the new material was not successful.")
-        
-        return
+        return "\n".join(vba)
     
\ No newline at end of file
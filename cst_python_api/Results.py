@@ -145,7 +145,7 @@ class Results:
         # Retrieve the list of runIDs in the project
         try:
             runIDlist = self.__MWS.Resulttree.GetResultIDsFromTreeItem(
-                "1D Results\S-Parameters\\" + sParamString)
+                "1D Results\\S-Parameters\\" + sParamString)
         except com_error as errMsg:
             # If an error occurs, raise and exception and print the error
             # message produced by CST
@@ -161,7 +161,7 @@ class Results:
         # Fetch the S-parameter results for the specified runID
         try: 
             result1D = self.__MWS.Resulttree.GetResultFromTreeItem(
-                "1D Results\S-Parameters\\" + sParamString, runIDlist[runID])
+                "1D Results\\S-Parameters\\" + sParamString, runIDlist[runID])
         except com_error as errMsg:
             # If an error occurs, raise and exception and print the error
             # message produced by CST
@@ -2,7 +2,7 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from typing import Union, List
+from typing import Union
 import numpy as np
 from .CheckParam import CheckParam
 class Shape:
@@ -224,6 +224,52 @@ class Shape:
             executed by CST.
         """
         
+        # Generate the VBA code for the cylinder
+        vba = await self.getCylinderVBA(
+            xMin, yMin, zMin, extRad, intRad, name, component, material,
+            orientation, xMax, yMax, zMax, nSegments)
+        
+        # Send the VBA code to CST
+        self.__MWS._FlagAsMethod("AddToHistory")
+        result = self.__MWS.AddToHistory("define cylinder: " + name, vba)
+        
+        # Raise an exception if the code is not executed successfully.
+        if result != True:
+            raise RuntimeError(
+                "ERROR: Execution of the VBA code for creating the new cylinder " +
+                "was not successful. Check that the chosen material is defined" +
+                " and that the specified name is not currently in use inside " +
+                "the component where the cylinder must be created.")
+        
+        return
+    
+    async def getCylinderVBA(
+        self, xMin: Union[float, str], yMin: Union[float, str],
+        zMin: Union[float, str], extRad: Union[float, str],
+        intRad: Union[float, str], name: str, component: str, material: str,
+        orientation: str, xMax: Union[float, str]=0.0, yMax: Union[float, str]=0.0,
+        zMax: Union[float, str]=0.0, nSegments: int=0):
+        """Generate the VBA code for adding a cylinder to the 3D model.
+        
+        The parameters are validated and interpreted exactly as in addCylinder,
+        but the resulting code is returned instead of being sent to CST. This
+        allows combining several shapes in a single history entry.
+
+        Parameters
+        ----------
+        See addCylinder.
+
+        Returns
+        -------
+        str
+            VBA code defining the cylinder.
+
+        Raises
+        ------
+        See addCylinder. No RuntimeError is raised for the execution of the
+        VBA code, since it is not executed by this method.
+        """
+        
         # Check that name is of type str
         if not isinstance(name, str):
             raise TypeError("ERROR: name must be of type str.")
@@ -320,20 +366,8 @@ class Shape:
 
         # Join both pieces of VBA code
         vba = vba + vbaAux
-
-        # Send the VBA code to CST
-        self.__MWS._FlagAsMethod("AddToHistory")
-        result = self.__MWS.AddToHistory("define cylinder: " + name, vba)
-        
-        # Raise an exception if the code is not executed successfully.
-        if result != True:
-            raise RuntimeError(
-                "ERROR: Execution of the VBA code for creating the new cylinder " +
-                "was not successful. Check that the chosen material is defined" +
-                " and that the specified name is not currently in use inside " +
-                "the component where the cylinder must be created.")
         
-        return
+        return vba
     
     async def addSphere(
         self, xCen: Union[float, str], yCen: Union[float, str],
@@ -2,8 +2,36 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from .CST_MicrowaveStudio import *
-from .Parameter import Parameter 
+import importlib
+import sys
+import types
+
+# Names whose modules depend on the COM bindings (win32com/pywintypes) are only
+# imported on first access (PEP 562).
+_LAZY = {
+    "CST_MicrowaveStudio": ".CST_MicrowaveStudio",
+    "Results": ".Results",
+    "get_boresight_metrics": ".analysis",
+    "get_gain_at_freq": ".analysis",
+    "get_axial_ratio_at_freq": ".analysis",
+}
+
+
+class _Package(types.ModuleType):
+    """Package module that keeps lazy names bound to their objects."""
+
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it on the package under its own name,
+        # which would shadow the class of the same name (e.g. Results).
+        if name in _LAZY and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+from .constants import CST_EXTENSION, MAX_LENGTH_PARAMETER_DESCRIPTION
+from .Parameter import Parameter
 from .Material import Material
 from .Shape import Shape
 from .Boolean import Boolean
@@ -11,11 +39,23 @@ from .Transform import Transform
 from .Component import Component
 from .Port import Port
 from .Solver import Solver
-from .Results import Results
 from .Build import Build
 from .CheckParam import CheckParam
 from .assemblies import create_coax_and_port
-from .analysis import get_gain_at_freq, get_axial_ratio_at_freq
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __version__ = "0.1.1"
-__version_name__ = "Hanter dro"
\ No newline at end of file
+__version_name__ = "Hanter dro"
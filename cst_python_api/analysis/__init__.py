@@ -2,6 +2,14 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from .farfield import get_gain_at_freq, get_axial_ratio_at_freq
+from .farfield import (
+    get_boresight_metrics,
+    get_gain_at_freq,
+    get_axial_ratio_at_freq,
+)
 
-__all__ = ["get_gain_at_freq", "get_axial_ratio_at_freq"]
+__all__ = [
+    "get_boresight_metrics",
+    "get_gain_at_freq",
+    "get_axial_ratio_at_freq",
+]
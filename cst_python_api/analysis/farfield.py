@@ -6,33 +6,233 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import math
+import os
+from numbers import Integral as _Integral, Real as _Real
+import warnings
+from typing import Any, Dict, List, Sequence, Tuple
 
 import numpy as np
+from numpy.typing import NDArray
 from pywintypes import com_error
 
 
-__all__ = ["get_gain_at_freq", "get_axial_ratio_at_freq"]
-
-
-def _validate_common_inputs(myCST: Any, target_freq: float, port: int, mode: int) -> None:
-    """Validate shared arguments for farfield helper routines."""
+__all__ = [
+    "get_boresight_metrics",
+    "get_gain_at_freq",
+    "get_axial_ratio_at_freq",
+]
+
+# Boresight evaluation point (theta = 0 degrees, phi = 0 degrees). Shared by
+# every call, so they are made read-only.
+_THETA0 = np.zeros(1)
+_THETA0.flags.writeable = False
+_PHI0 = np.zeros(1)
+_PHI0.flags.writeable = False
+
+# Deprecation warnings skip the event loop frames, so that they point at the
+# caller also when the helper is the coroutine passed to asyncio.run().
+_ASYNCIO_DIR = (os.path.dirname(asyncio.__file__),)
+
+# A result spec is (plotMode, polarization, component, complexComp, linearScale)
+FarFieldSpec = Tuple[str, str, str, str, bool]
+
+_GAIN_SPECS: List[FarFieldSpec] = [
+    ("realized gain", "circular", "theta", "abs", False),
+    ("realized gain", "circular", "phi", "abs", False),
+]
+_AXIAL_RATIO_SPECS: List[FarFieldSpec] = [
+    ("efield", "circular", "right", "abs", True),
+    ("efield", "circular", "left", "abs", True),
+]
+# Realised gain in linear scale is proportional to |E|^2, so the total gain and
+# the circular components required by the axial ratio can share one query.
+_GAIN_AND_AXIAL_RATIO_SPECS: List[FarFieldSpec] = [
+    ("realized gain", "circular", "theta", "abs", True),
+    ("realized gain", "circular", "phi", "abs", True),
+    ("realized gain", "circular", "right", "abs", True),
+    ("realized gain", "circular", "left", "abs", True),
+]
+
+
+def _validate_common_inputs(
+    myCST: Any, target_freq: float, port: int, mode: int
+) -> Tuple[float, int, int]:
+    """Validate shared arguments for farfield helper routines.
+
+    Returns ``(target_freq, port, mode)`` converted to builtin ``float`` and
+    ``int``. ``Results.getFarField`` only accepts these types, and they are
+    marshalled to COM directly, unlike NumPy scalars.
+    """
 
     if myCST is None:
         raise TypeError("ERROR: myCST object must be provided.")
-    if not isinstance(target_freq, (float, int)):
-        raise TypeError("ERROR: target_freq must be float or int.")
-    if not isinstance(port, int):
-        raise TypeError("ERROR: port must be of type int.")
+    if not isinstance(target_freq, _Real):
+        raise TypeError("ERROR: target_freq must be a real number.")
+    if not isinstance(port, _Integral):
+        raise TypeError("ERROR: port must be an integer.")
     if port < 1:
         raise ValueError("ERROR: port must be an integer >= 1.")
-    if not isinstance(mode, int):
-        raise TypeError("ERROR: mode must be of type int.")
+    if not isinstance(mode, _Integral):
+        raise TypeError("ERROR: mode must be an integer.")
     if mode < 0:
         raise ValueError("ERROR: mode must be an integer >= 0.")
 
+    if type(target_freq) is not float:
+        target_freq = float(target_freq)
+    if type(port) is not int:
+        port = int(port)
+    if type(mode) is not int:
+        mode = int(mode)
+
+    return target_freq, port, mode
+
+
+async def _call_farfield(myCST: Any, **kwargs: Any) -> List[NDArray[Any]]:
+    """Call ``Results.getFarField`` and normalise its failure modes.
+
+    Every error is reported as a ``RuntimeError``, and so is a result holding
+    fewer arrays than requested components.
+    """
+
+    try:
+        farfield_results = await myCST.Results.getFarField(**kwargs)
+    except com_error as err:
+        info = getattr(err, "excepinfo", None)
+        details = info[2] if info else ""
+        raise RuntimeError(
+            f"ERROR: CST failed to retrieve farfield data. Details: {details}"
+        ) from err
+    except Exception as err:  # pragma: no cover - passthrough for unexpected errors
+        raise RuntimeError(
+            f"ERROR: Unexpected failure retrieving farfield results. {err}"
+        ) from err
+
+    if not farfield_results or len(farfield_results) < len(kwargs["component"]):
+        raise RuntimeError("ERROR: Farfield results are empty or incomplete.")
 
-def get_gain_at_freq(
+    return farfield_results
+
+
+async def _batched_farfield(
+    myCST: Any,
+    freq: float,
+    theta_arr: NDArray[Any],
+    phi_arr: NDArray[Any],
+    specs: Sequence[FarFieldSpec],
+    *,
+    port: int = 1,
+    mode: int = 0,
+) -> List[NDArray[Any]]:
+    """Evaluate several farfield result specs with as few CST queries as possible.
+
+    ``Results.getFarField`` accepts a list of components per call, but the plot
+    mode, polarization and scale are shared by the whole call. Specs are
+    therefore grouped on ``(plotMode, polarization, linearScale)`` and each
+    group is dispatched as a single ``getFarField`` request whose
+    ``component``/``complexComp`` lists are the concatenation of the group.
+
+    Parameters
+    ----------
+    myCST : Any
+        Active CST project wrapper exposing ``Results.getFarField``.
+    freq : float
+        Frequency for which the farfield monitor was defined.
+    theta_arr, phi_arr : NDArray[Any]
+        One-dimensional arrays of theta and phi points (in degrees).
+    specs : Sequence[FarFieldSpec]
+        ``(plotMode, polarization, component, complexComp, linearScale)``
+        tuples describing each requested result.
+    port : int, optional
+        Excitation port number, by default 1.
+    mode : int, optional
+        Port mode number, by default 0.
+
+    Returns
+    -------
+    List[NDArray[Any]]
+        One ``len(theta_arr)`` x ``len(phi_arr)`` array per entry of ``specs``,
+        in the same order.
+
+    Raises
+    ------
+    RuntimeError
+        If the farfield monitor cannot be retrieved or is incomplete.
+    """
+
+    # Group the specs preserving the position of each one in the output list
+    groups = {}
+    for index, (plotMode, polarization, component, complexComp, linearScale) in enumerate(specs):
+        key = (plotMode, polarization, linearScale)
+        groups.setdefault(key, []).append((index, component, complexComp))
+
+    results: List[Any] = [None] * len(specs)
+
+    for (plotMode, polarization, linearScale), entries in groups.items():
+        farfield_results = await _call_farfield(
+            myCST,
+            freq=freq,
+            theta=theta_arr,
+            phi=phi_arr,
+            port=port,
+            mode=mode,
+            plotMode=plotMode,
+            coordSys="spherical",
+            polarization=polarization,
+            component=[component for _, component, _ in entries],
+            complexComp=[complexComp for _, _, complexComp in entries],
+            linearScale=linearScale,
+        )
+
+        for (index, _, _), values in zip(entries, farfield_results):
+            results[index] = values
+
+    return results
+
+
+def _scalar(value: Any) -> float:
+    """Convert a single-point farfield result to a Python float.
+
+    Plain numbers are converted directly; only array-like values are routed
+    through NumPy.
+    """
+
+    if isinstance(value, _Real):
+        return float(value)
+    return float(np.asarray(value).item())
+
+
+def _to_dB(ratio: float, factor: float) -> float:
+    """Return ``factor * log10(ratio)``, or ``-inf`` for a zero ratio.
+
+    A boresight null (e.g. a z-directed coax feed) gives zero components, for
+    which ``math.log10`` would raise instead of returning ``-inf``.
+    """
+
+    if ratio > 0.0:
+        return factor * math.log10(ratio)
+    return -math.inf
+
+
+def _combine_gain(theta_component: float, phi_component: float) -> float:
+    """Add two realised gain components given in dBi."""
+
+    return _to_dB(
+        10.0 ** (theta_component / 10.0) + 10.0 ** (phi_component / 10.0), 10.0
+    )
+
+
+def _combine_axial_ratio(right: float, left: float) -> float:
+    """Compute the axial ratio (dB) from circular field magnitudes."""
+
+    emax = max(right, left)
+    emin = min(right, left)
+    ar_linear = (emax + emin) / max(emax - emin, 1e-300)
+    return _to_dB(ar_linear, 20.0)
+
+
+async def get_gain_at_freq(
     myCST: Any,
     *,
     target_freq: float = 0.868,
@@ -47,6 +247,10 @@ def get_gain_at_freq(
     gain components, combines them in linear scale, and returns the total gain
     in dBi.
 
+    .. deprecated:: 0.1.1
+        Use :func:`get_boresight_metrics`, which also returns the axial ratio
+        from the same farfield query.
+
     Parameters
     ----------
     myCST : Any
@@ -73,54 +277,33 @@ def get_gain_at_freq(
         If the farfield monitor cannot be retrieved or parsed.
     """
 
-    _validate_common_inputs(myCST, target_freq, port, mode)
-
-    theta = np.array([0.0])
-    phi = np.array([0.0])
+    warnings.warn(
+        "get_gain_at_freq is deprecated; use get_boresight_metrics instead.",
+        DeprecationWarning,
+        stacklevel=2,
+        skip_file_prefixes=_ASYNCIO_DIR,
+    )
 
-    try:
-        farfield_results_gain = myCST.Results.getFarField(
-            freq=target_freq,
-            theta=theta,
-            phi=phi,
-            port=port,
-            mode=mode,
-            plotMode="realized gain",
-            coordSys="spherical",
-            polarization="circular",
-            component=["theta", "phi"],
-            complexComp=["abs", "abs"],
-            linearScale=False,
-        )
-    except com_error as err:
-        details = getattr(err, "excepinfo", (None, None, ""))
-        raise RuntimeError(
-            f"ERROR: CST failed to retrieve farfield data. Details: {details[2]}"
-        ) from err
-    except Exception as err:  # pragma: no cover - passthrough for unexpected errors
-        raise RuntimeError(
-            f"ERROR: Unexpected failure retrieving farfield results. {err}"
-        ) from err
+    target_freq, port, mode = _validate_common_inputs(
+        myCST, target_freq, port, mode
+    )
 
-    if not farfield_results_gain or len(farfield_results_gain) < 2:
-        raise RuntimeError("ERROR: Farfield results are empty or incomplete.")
+    farfield_results = await _batched_farfield(
+        myCST, target_freq, _THETA0, _PHI0, _GAIN_SPECS, port=port, mode=mode
+    )
 
     try:
-        theta_component = float(np.asarray(farfield_results_gain[0]).item())
-        phi_component = float(np.asarray(farfield_results_gain[1]).item())
+        theta_component = _scalar(farfield_results[0])
+        phi_component = _scalar(farfield_results[1])
     except Exception as err:  # pragma: no cover - defensive parsing guard
         raise RuntimeError(
             "ERROR: Could not extract theta/phi values from CST farfield."
         ) from err
 
-    gain_dBi = 10.0 * np.log10(
-        10.0 ** (theta_component / 10.0) + 10.0 ** (phi_component / 10.0)
-    )
-
-    return gain_dBi
+    return _combine_gain(theta_component, phi_component)
 
 
-def get_axial_ratio_at_freq(
+async def get_axial_ratio_at_freq(
     myCST: Any,
     *,
     target_freq: float = 0.868,
@@ -135,6 +318,10 @@ def get_axial_ratio_at_freq(
     electric field components, combines them in linear scale, and returns the
     axial ratio in dB.
 
+    .. deprecated:: 0.1.1
+        Use :func:`get_boresight_metrics`, which also returns the realised gain
+        from the same farfield query.
+
     Parameters
     ----------
     myCST : Any
@@ -161,50 +348,100 @@ def get_axial_ratio_at_freq(
         If the farfield monitor cannot be retrieved or parsed.
     """
 
-    _validate_common_inputs(myCST, target_freq, port, mode)
+    warnings.warn(
+        "get_axial_ratio_at_freq is deprecated; use get_boresight_metrics instead.",
+        DeprecationWarning,
+        stacklevel=2,
+        skip_file_prefixes=_ASYNCIO_DIR,
+    )
 
-    theta = np.array([0.0])
-    phi = np.array([0.0])
+    target_freq, port, mode = _validate_common_inputs(
+        myCST, target_freq, port, mode
+    )
+
+    farfield_results = await _batched_farfield(
+        myCST, target_freq, _THETA0, _PHI0, _AXIAL_RATIO_SPECS, port=port, mode=mode
+    )
 
     try:
-        farfield_results = myCST.Results.getFarField(
-            freq=target_freq,
-            theta=theta,
-            phi=phi,
-            port=port,
-            mode=mode,
-            plotMode="efield",
-            coordSys="spherical",
-            polarization="circular",
-            component=["right", "left"],
-            complexComp=["abs", "abs"],
-            linearScale=True,
-        )
-    except com_error as err:
-        details = getattr(err, "excepinfo", (None, None, ""))
-        raise RuntimeError(
-            f"ERROR: CST failed to retrieve farfield data. Details: {details[2]}"
-        ) from err
-    except Exception as err:  # pragma: no cover - passthrough for unexpected errors
+        right = _scalar(farfield_results[0])
+        left = _scalar(farfield_results[1])
+    except Exception as err:  # pragma: no cover - defensive parsing guard
         raise RuntimeError(
-            f"ERROR: Unexpected failure retrieving farfield results. {err}"
+            "ERROR: Could not extract circular components from CST farfield."
         ) from err
 
-    if not farfield_results or len(farfield_results) < 2:
-        raise RuntimeError("ERROR: Farfield results are empty or incomplete.")
+    return _combine_axial_ratio(right, left)
+
+
+async def get_boresight_metrics(
+    myCST: Any,
+    *,
+    target_freq: float = 0.868,
+    port: int = 1,
+    mode: int = 0,
+) -> Dict[str, float]:
+    """Retrieve the realised gain and axial ratio at boresight.
+
+    Equivalent to calling :func:`get_gain_at_freq` and
+    :func:`get_axial_ratio_at_freq` with the same arguments, but all the
+    components are requested from CST in a single farfield query. The
+    realised gain is read in linear scale so that the circular components can
+    be converted to field magnitudes for the axial ratio.
+
+    Parameters
+    ----------
+    myCST : Any
+        Active CST project wrapper exposing ``Results.getFarField``.
+    target_freq : float, optional
+        Frequency for which the farfield monitor was defined.
+    port : int, optional
+        Excitation port number. Must be greater or equal to 1.
+    mode : int, optional
+        Port mode number. Use 0 for single-mode ports.
+
+    Returns
+    -------
+    Dict[str, float]
+        ``{"gain_dBi": ..., "axial_ratio_dB": ...}`` evaluated at
+        ``theta=0 degrees`` and ``phi=0 degrees``.
+
+    Raises
+    ------
+    TypeError
+        If any argument does not present the expected type.
+    ValueError
+        If ``port`` or ``mode`` violate their allowed ranges.
+    RuntimeError
+        If the farfield monitor cannot be retrieved or parsed.
+    """
+
+    target_freq, port, mode = _validate_common_inputs(
+        myCST, target_freq, port, mode
+    )
+
+    farfield_results = await _batched_farfield(
+        myCST,
+        target_freq,
+        _THETA0,
+        _PHI0,
+        _GAIN_AND_AXIAL_RATIO_SPECS,
+        port=port,
+        mode=mode,
+    )
 
     try:
-        right = float(np.asarray(farfield_results[0]).item())
-        left = float(np.asarray(farfield_results[1]).item())
+        theta_gain, phi_gain, right_gain, left_gain = (
+            _scalar(values) for values in farfield_results
+        )
     except Exception as err:  # pragma: no cover - defensive parsing guard
         raise RuntimeError(
-            "ERROR: Could not extract circular components from CST farfield."
+            "ERROR: Could not extract gain components from CST farfield."
         ) from err
 
-    emax, emin = (right, left) if right >= left else (left, right)
-    numerator = emax + emin
-    denominator = max(emax - emin, 1e-300)
-    ar_linear = numerator / denominator
-    ar_dB = 20.0 * np.log10(ar_linear)
-
-    return ar_dB
+    return {
+        "gain_dBi": _to_dB(theta_gain + phi_gain, 10.0),
+        "axial_ratio_dB": _combine_axial_ratio(
+            math.sqrt(right_gain), math.sqrt(left_gain)
+        ),
+    }
@@ -2,10 +2,23 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from typing import Any
+from typing import Any, Iterable, List
 
+from ..cache import loaded_materials
 
-def create_coax_and_port(
+
+async def _library_materials_vba(myCST: Any, names: Iterable[str]) -> List[str]:
+    """VBA code for the library materials not yet defined in the project."""
+
+    loaded = loaded_materials.setdefault(myCST, set())
+    return [
+        await myCST.Build.Material.getMaterialFromLibVBA(name)
+        for name in dict.fromkeys(names)
+        if name not in loaded
+    ]
+
+
+async def create_coax_and_port(
     myCST: Any,
     *,
     xfeed: float = 0.0,
@@ -66,16 +79,19 @@ def create_coax_and_port(
         The CST project is modified in place.
     """
 
-    # Ensure required materials are loaded from the CST library.
-    myCST.Build.Material.addMaterialFromLib(inner_mat)
-    myCST.Build.Material.addMaterialFromLib(consub_mat)
-    myCST.Build.Material.addMaterialFromLib(outer_mat)
-
     # Ensure the destination component exists before creating solids.
-    myCST.Build.Component.ensureExistence(coax_component)
+    await myCST.Build.Component.ensureExistence(coax_component)
+
+    # Collect the VBA code for the materials and solids so that the whole coax
+    # is sent to CST as a single history entry.
+    vba = []
+
+    # Ensure required materials are loaded from the CST library.
+    materials = (inner_mat, consub_mat, outer_mat)
+    vba += await _library_materials_vba(myCST, materials)
 
     # Inner conductor (solid cylinder spanning the feed penetration depth).
-    myCST.Build.Shape.addCylinder(
+    vba.append(await myCST.Build.Shape.getCylinderVBA(
         xMin=xfeed,
         yMin=yfeed,
         zMin=feed_z_bot,
@@ -86,10 +102,10 @@ def create_coax_and_port(
         component=coax_component,
         material=inner_mat,
         orientation="z",
-    )
+    ))
 
     # Dielectric layer (hollow cylinder stopping at the ground reference plane).
-    myCST.Build.Shape.addCylinder(
+    vba.append(await myCST.Build.Shape.getCylinderVBA(
         xMin=xfeed,
         yMin=yfeed,
         zMin=feed_z_bot,
@@ -100,10 +116,10 @@ def create_coax_and_port(
         component=coax_component,
         material=consub_mat,
         orientation="z",
-    )
+    ))
 
     # Outer metallic shield (hollow cylinder terminating at the ground plane).
-    myCST.Build.Shape.addCylinder(
+    vba.append(await myCST.Build.Shape.getCylinderVBA(
         xMin=xfeed,
         yMin=yfeed,
         zMin=feed_z_bot,
@@ -114,11 +130,12 @@ def create_coax_and_port(
         component=coax_component,
         material=outer_mat,
         orientation="z",
-    )
+    ))
 
+    cut_name = "CoaxCut"
     if make_ground_cut:
-        cut_name = "CoaxCut"
-        myCST.Build.Shape.addCylinder(
+        # Cutting tool for the ground opening (removed by the subtraction).
+        vba.append(await myCST.Build.Shape.getCylinderVBA(
             xMin=xfeed,
             yMin=yfeed,
             zMin=feed_z_bot,
@@ -129,13 +146,20 @@ def create_coax_and_port(
             component=coax_component,
             material="Vacuum",
             orientation="z",
-        )
-        myCST.Build.Boolean.subtract(
+        ))
+
+    await myCST.Build.addToHistory(
+        f"define coax feed: {coax_component}", "\n".join(vba)
+    )
+    loaded_materials[myCST].update(materials)
+
+    if make_ground_cut:
+        await myCST.Build.Boolean.subtract(
             f"{ground_component}",
             f"{coax_component}:{cut_name}"
         )
 
-    myCST.Solver.Port.addWaveguidePort(
+    await myCST.Solver.Port.addWaveguidePort(
         xMin=xfeed - outer_shield_outer_rad,
         xMax=xfeed + outer_shield_outer_rad,
         yMin=yfeed - outer_shield_outer_rad,
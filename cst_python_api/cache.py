@@ -0,0 +1,18 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""This module keeps per-project caches shared by the package"""
+
+import weakref
+from typing import Any, Set
+
+# Library materials already defined in each CST project during this session.
+# Entries disappear together with the project wrapper they belong to.
+loaded_materials: "weakref.WeakKeyDictionary[Any, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def forget_project(myCST: Any) -> None:
+    """Discard everything cached for a project (e.g. when it is closed)."""
+
+    loaded_materials.pop(myCST, None)
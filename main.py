@@ -1,9 +1,4 @@
-import cst_python_api as cpa
-from openai import OpenAI
 from agents.mcp import MCPServerStdio
-import os
-import gradio as gr
-from dotenv import load_dotenv
 import asyncio
 
 params = {
@@ -11,10 +6,61 @@ params = {
     "args": ["run", "-m", "cst_python_api.CST_API_SERVER"]
 }
 
+# Maximum number of tool calls in flight at once over the stdio pipe
+N_CONCURRENT_CALLS = 4
+
+
+class CstSession:
+    """Long-lived connection to the CST MCP server.
+
+    Keeps a single MCPServerStdio subprocess alive for as long as the context
+    is open, so it can be created once at application startup and shared by
+    every handler instead of relaunching the server for each request.
+    """
+
+    def __init__(self, params=params, max_concurrent_calls=N_CONCURRENT_CALLS):
+        self._params = params
+        self._semaphore = asyncio.Semaphore(max_concurrent_calls)
+        self._cm = None
+        self.server = None
+
+    async def __aenter__(self):
+        self._cm = MCPServerStdio(
+            params=self._params,
+            client_session_timeout_seconds=30,
+            cache_tools_list=True,
+        )
+        self.server = await self._cm.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            return await self._cm.__aexit__(exc_type, exc, tb)
+        finally:
+            self._cm = None
+            self.server = None
+
+    async def call_tool(self, name, arguments=None):
+        """Call a single tool, limiting the number of concurrent calls."""
+        async with self._semaphore:
+            return await self.server.call_tool(name, arguments)
+
+    async def call_tools(self, calls):
+        """Run independent (name, arguments) tool calls concurrently."""
+        return await asyncio.gather(
+            *(self.call_tool(name, arguments) for name, arguments in calls)
+        )
+
+
 async def main():
-    async with MCPServerStdio(params=params, client_session_timeout_seconds=30) as server:
-        mcp_tools = await server.list_tools()
+    async with CstSession() as session:
+        # Run the discovery requests concurrently over the same session
+        mcp_tools, mcp_resources = await asyncio.gather(
+            session.server.list_tools(),
+            session.server.session.list_resources(),
+        )
         print(mcp_tools)
+        print(mcp_resources.resources)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
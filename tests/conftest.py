@@ -0,0 +1,26 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Make the package importable on machines without the Windows COM bindings.
+
+The tests only exercise import-time behaviour, so when pywin32 is not
+installed minimal placeholders for ``pywintypes`` and ``win32com.client`` are
+registered. Nothing here talks to CST.
+"""
+
+import sys
+import types
+
+try:
+    import pywintypes  # noqa: F401
+    import win32com.client  # noqa: F401
+except ImportError:
+    pywintypes = types.ModuleType("pywintypes")
+    pywintypes.com_error = type("com_error", (Exception,), {})
+    win32com = types.ModuleType("win32com")
+    win32com.client = types.ModuleType("win32com.client")
+    win32com.__path__ = []
+    sys.modules.setdefault("pywintypes", pywintypes)
+    sys.modules.setdefault("win32com", win32com)
+    sys.modules.setdefault("win32com.client", win32com.client)
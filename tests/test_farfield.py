@@ -0,0 +1,170 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import asyncio
+import inspect
+import math
+import warnings
+
+import numpy as np
+import pytest
+
+from cst_python_api.analysis import farfield
+
+
+class FakeResults:
+    """Stand-in for Results.getFarField built from linear realised gains.
+
+    "realized gain" returns the gain in linear or dB scale, and "efield"
+    returns a magnitude proportional to the square root of the gain.
+    """
+
+    def __init__(self, gains):
+        self.gains = gains
+        self.calls = []
+
+    async def getFarField(self, **kwargs):
+        self.calls.append(kwargs)
+        results = []
+        for component in kwargs["component"]:
+            gain = self.gains[component]
+            if kwargs["plotMode"] == "efield":
+                value = 3.0 * math.sqrt(gain)
+            elif kwargs["linearScale"]:
+                value = gain
+            else:
+                value = 10.0 * math.log10(gain) if gain > 0.0 else -math.inf
+            results.append(np.array([[value]]))
+        return results
+
+
+class FakeCST:
+    def __init__(self, **gains):
+        self.Results = FakeResults(gains)
+
+
+def run(coroutine):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return asyncio.run(coroutine)
+
+
+def test_combine_axial_ratio_of_a_null_is_minus_inf():
+    assert farfield._combine_axial_ratio(0.0, 0.0) == -math.inf
+
+
+def test_combine_gain_of_a_null_is_minus_inf():
+    assert farfield._combine_gain(-math.inf, -math.inf) == -math.inf
+
+
+def test_boresight_metrics_at_a_boresight_null():
+    myCST = FakeCST(theta=0.0, phi=0.0, right=0.0, left=0.0)
+
+    metrics = run(farfield.get_boresight_metrics(myCST))
+
+    assert metrics == {"gain_dBi": -math.inf, "axial_ratio_dB": -math.inf}
+
+
+def test_public_helpers_are_coroutines():
+    for name in farfield.__all__:
+        assert inspect.iscoroutinefunction(getattr(farfield, name))
+
+
+def test_batched_farfield_groups_specs_and_keeps_their_order():
+    myCST = FakeCST(theta=2.0, phi=1.0, right=2.5, left=0.5)
+    specs = [
+        ("efield", "circular", "right", "abs", True),
+        ("realized gain", "circular", "theta", "abs", True),
+        ("efield", "circular", "left", "abs", True),
+    ]
+
+    results = run(farfield._batched_farfield(
+        myCST, 1.0, farfield._THETA0, farfield._PHI0, specs
+    ))
+
+    calls = myCST.Results.calls
+    assert [call["plotMode"] for call in calls] == ["efield", "realized gain"]
+    assert calls[0]["component"] == ["right", "left"]
+    assert calls[1]["component"] == ["theta"]
+    assert [r.item() for r in results] == pytest.approx(
+        [3.0 * math.sqrt(2.5), 2.0, 3.0 * math.sqrt(0.5)]
+    )
+
+
+def test_combined_query_matches_the_single_metric_helpers():
+    gains = dict(theta=2.0, phi=1.0, right=2.5, left=0.5)
+    myCST = FakeCST(**gains)
+
+    metrics = run(farfield.get_boresight_metrics(myCST))
+
+    assert len(myCST.Results.calls) == 1
+    assert metrics["gain_dBi"] == pytest.approx(
+        run(farfield.get_gain_at_freq(FakeCST(**gains)))
+    )
+    assert metrics["axial_ratio_dB"] == pytest.approx(
+        run(farfield.get_axial_ratio_at_freq(FakeCST(**gains)))
+    )
+
+
+def test_incomplete_results_raise_runtime_error():
+    class ShortResults(FakeResults):
+        async def getFarField(self, **kwargs):
+            return (await super().getFarField(**kwargs))[:-1]
+
+    myCST = FakeCST()
+    myCST.Results = ShortResults(dict(theta=2.0, phi=1.0))
+
+    with pytest.raises(RuntimeError, match="empty or incomplete"):
+        run(farfield.get_gain_at_freq(myCST))
+
+
+def test_com_error_without_excepinfo_raises_runtime_error():
+    class FailingResults:
+        async def getFarField(self, **kwargs):
+            err = farfield.com_error()
+            err.excepinfo = None
+            raise err
+
+    myCST = FakeCST()
+    myCST.Results = FailingResults()
+
+    with pytest.raises(RuntimeError, match="Details: $"):
+        run(farfield.get_gain_at_freq(myCST))
+
+
+def test_validate_common_inputs_returns_builtin_types():
+    values = farfield._validate_common_inputs(
+        object(), np.float64(0.868), np.int64(2), np.int64(1)
+    )
+
+    assert values == (0.868, 2, 1)
+    assert [type(v) for v in values] == [float, int, int]
+
+
+def test_numpy_scalars_reach_getfarfield_as_builtins():
+    myCST = FakeCST(theta=2.0, phi=1.0, right=2.5, left=0.5)
+
+    run(farfield.get_boresight_metrics(
+        myCST, target_freq=np.float64(0.868), port=np.int64(1), mode=np.int64(0)
+    ))
+
+    call = myCST.Results.calls[0]
+    assert type(call["freq"]) is float
+    assert type(call["port"]) is int
+    assert type(call["mode"]) is int
+
+
+@pytest.mark.parametrize("name", ["get_gain_at_freq", "get_axial_ratio_at_freq"])
+def test_deprecation_warning_points_at_the_caller(name):
+    helper = getattr(farfield, name)
+    myCST = FakeCST(theta=2.0, phi=1.0, right=2.5, left=0.5)
+
+    async def caller():
+        return await helper(myCST)
+
+    for coroutine in (helper(myCST), caller()):
+        with pytest.warns(DeprecationWarning, match=name) as record:
+            asyncio.run(coroutine)
+
+        assert record[0].filename == __file__
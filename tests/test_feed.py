@@ -0,0 +1,109 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import asyncio
+import sys
+
+import pytest
+
+from cst_python_api import cache
+from cst_python_api.Build import Build
+from cst_python_api.CST_MicrowaveStudio import CST_MicrowaveStudio
+from cst_python_api.Solver import Solver
+from cst_python_api.assemblies import create_coax_and_port
+
+
+class FakeMWS:
+    """Stand-in for the MWS COM object that records the history entries."""
+
+    def __init__(self):
+        self.history = []
+        self.components = set()
+        self.quit_called = False
+        self.Component = self
+        self.Port = self
+
+    def _FlagAsMethod(self, name):
+        pass
+
+    def AddToHistory(self, command, vba):
+        self.history.append((command, vba))
+        if command.startswith("new component: "):
+            self.components.add(command[len("new component: "):])
+        return True
+
+    async def DoesExist(self, name):
+        return name in self.components
+
+    @property
+    def StartPortNumberIteration(self):
+        async def count():
+            return sum(c.startswith("define waveguide port") for c, _ in self.history)
+        return count()
+
+    def Quit(self):
+        self.quit_called = True
+
+
+class FakeCST:
+    def __init__(self, mws):
+        self.Build = Build(mws)
+        self.Solver = Solver(mws)
+
+
+@pytest.fixture
+def mws(tmp_path, monkeypatch):
+    for name in ("Copper (annealed)", "PTFE (lossy)", "Vacuum"):
+        (tmp_path / f"{name}.mtd").write_text(
+            '[Definition]\n.Type "Normal"\n.Epsilon "1"\n[Type]\nNormal\n',
+            encoding="utf-8",
+        )
+    monkeypatch.setattr(
+        sys.modules["cst_python_api.Material"], "materials_dir", tmp_path
+    )
+    return FakeMWS()
+
+
+def feed_entries(mws):
+    return [vba for command, vba in mws.history
+            if command.startswith("define coax feed: ")]
+
+
+def test_coax_feed_is_a_single_history_entry(mws):
+    asyncio.run(create_coax_and_port(FakeCST(mws)))
+
+    [vba] = feed_entries(mws)
+    # inner_mat == outer_mat is only defined once
+    assert vba.count('.Name "Copper (annealed)"') == 1
+    assert vba.count('.Name "PTFE (lossy)"') == 1
+    # materials are defined before the cylinders that use them
+    assert vba.rindex("With Material") < vba.index("With Cylinder")
+
+
+def test_second_feed_reuses_the_loaded_materials(mws):
+    myCST = FakeCST(mws)
+
+    async def place_two_feeds():
+        await create_coax_and_port(myCST)
+        await create_coax_and_port(myCST, xfeed=10.0, make_ground_cut=False)
+
+    asyncio.run(place_two_feeds())
+
+    first, second = feed_entries(mws)
+    assert "With Material" in first
+    assert "With Material" not in second
+    assert "With Cylinder" in second
+    assert cache.loaded_materials[myCST] == {"Copper (annealed)", "PTFE (lossy)"}
+
+
+def test_closeFile_forgets_the_loaded_materials():
+    mws = FakeMWS()
+    myCST = CST_MicrowaveStudio.__new__(CST_MicrowaveStudio)
+    myCST._CST_MicrowaveStudio__MWS = mws
+    cache.loaded_materials[myCST] = {"Copper (annealed)"}
+
+    asyncio.run(myCST.closeFile())
+
+    assert myCST not in cache.loaded_materials
+    assert mws.quit_called
@@ -0,0 +1,21 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import importlib
+import inspect
+
+import cst_python_api
+
+
+def test_lazy_names_resolve_to_classes_after_submodule_imports():
+    # Accessing CST_MicrowaveStudio imports the Results submodule as a side
+    # effect, and the server imports every submodule.
+    assert inspect.isclass(cst_python_api.CST_MicrowaveStudio)
+    assert inspect.isclass(cst_python_api.Results)
+
+    importlib.import_module("cst_python_api.CST_API_SERVER")
+
+    assert inspect.isclass(cst_python_api.CST_MicrowaveStudio)
+    assert inspect.isclass(cst_python_api.Results)
+    assert inspect.iscoroutinefunction(cst_python_api.get_gain_at_freq)
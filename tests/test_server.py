@@ -0,0 +1,60 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import asyncio
+
+from cst_python_api import CST_API_SERVER
+
+
+def test_every_tool_in_TOOLS_is_registered():
+    tools = asyncio.run(CST_API_SERVER.mcp.list_tools())
+
+    assert len(tools) == len(CST_API_SERVER.TOOLS)
+    assert {tool.name for tool in tools} == {
+        fn.__qualname__.replace(".", "_") for fn in CST_API_SERVER.TOOLS
+    }
+
+
+def test_no_tool_asks_for_the_project():
+    tools = asyncio.run(CST_API_SERVER.mcp.list_tools())
+
+    for tool in tools:
+        assert not {"self", "myCST"} & set(tool.inputSchema["properties"])
+
+
+class FakeMWS:
+    def __init__(self):
+        self.quit_called = False
+
+    def _FlagAsMethod(self, name):
+        pass
+
+    def DoesParameterExist(self, name):
+        return name == "h"
+
+    def Quit(self):
+        self.quit_called = True
+
+
+def test_tools_run_on_the_server_project(monkeypatch):
+    mws = FakeMWS()
+    project = CST_API_SERVER.CST_MicrowaveStudio.__new__(
+        CST_API_SERVER.CST_MicrowaveStudio
+    )
+    project._CST_MicrowaveStudio__MWS = mws
+    project.Project = CST_API_SERVER.Project(mws)
+    monkeypatch.setattr(CST_API_SERVER, "_project", project)
+
+    async def call_tools():
+        exists = await CST_API_SERVER.mcp.call_tool(
+            "Parameter_exist", {"paramName": "h"}
+        )
+        await CST_API_SERVER.mcp.call_tool("CST_MicrowaveStudio_closeFile", {})
+        return exists
+
+    [content] = asyncio.run(call_tools())
+
+    assert content.text == "true"
+    assert mws.quit_called
+    assert CST_API_SERVER._project is None